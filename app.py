@@ -1,44 +1,149 @@
 import dash
 from dash import dcc, html, Input, Output, callback, dash_table
 import pandas as pd
-import plotly.express as px
+from plotly.colors import qualitative, sequential
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
 import numpy as np
+from numba import njit, prange
 from datetime import datetime, timedelta
-import base64
+from functools import lru_cache
+import json
 import os
 import flask
 from flask import send_from_directory, abort
+from flask_caching import Cache
+from werkzeug.exceptions import NotFound
 import warnings
 warnings.filterwarnings('ignore')
 
-# Initialize Flask server first
-server = flask.Flask(__name__)
+# Initialize Flask server first; /static is served by the routes below
+server = flask.Flask(__name__, static_folder=None)
+
+# In-process cache for callback results that only depend on their inputs
+# (the data is fixed for the life of the process, so entries can live for an hour)
+cache = Cache(server, config={'CACHE_TYPE': 'SimpleCache', 'CACHE_DEFAULT_TIMEOUT': 3600})
+
+# Data source and prepared-data cache
+DATA_FILE = "Covid_Analysis_Data.csv"
+CACHE_FILE = "covid_prepared.parquet"
+CACHE_META_FILE = "covid_prepared.json"
+# Bump whenever the preparation steps change so stale caches are rebuilt
+CACHE_VERSION = 10
+
+# Columns the dashboard reads from the CSV, with explicit types so nothing is inferred
+DATA_COLUMNS = {
+    'location': 'string',
+    'date': 'datetime64[s]',
+    'total_cases': 'float64',
+    'total_deaths': 'float64',
+    'population': 'float64'
+}
+
+def get_cache_key():
+    """Identify the CSV contents and preparation steps the cache must match"""
+    stat = os.stat(DATA_FILE)
+    return {'version': CACHE_VERSION, 'source_mtime': stat.st_mtime, 'source_size': stat.st_size}
+
+def load_cached_data(cache_key):
+    """Return the cached prepared DataFrame, or None if it is missing or stale"""
+    if not (os.path.exists(CACHE_FILE) and os.path.exists(CACHE_META_FILE)):
+        return None
+    try:
+        with open(CACHE_META_FILE) as f:
+            meta = json.load(f)
+        if meta != cache_key:
+            return None
+        df = pd.read_parquet(CACHE_FILE)
+        # Parquet has no seconds unit, so restore the date resolution used at load time
+        df['date'] = df['date'].astype(DATA_COLUMNS['date'])
+        return df
+    except Exception as e:
+        print(f"Error reading data cache: {e}")
+        return None
+
+def save_cached_data(df, cache_key):
+    """Write the prepared DataFrame and its sidecar metadata to the cache"""
+    try:
+        df.to_parquet(CACHE_FILE, index=False)
+        with open(CACHE_META_FILE, 'w') as f:
+            json.dump(cache_key, f)
+    except Exception as e:
+        print(f"Error writing data cache: {e}")
+
+# Groups are independent, so they are spread across threads; the compiled
+# kernel is cached on disk so only the first run pays the JIT cost
+@njit(parallel=True, cache=True)
+def rolling_mean_groups(arr, starts, window, out):
+    """Trailing rolling mean of a flat array, restarted at each group boundary"""
+    for g in prange(starts.shape[0] - 1):
+        lo, hi = starts[g], starts[g + 1]
+        total = 0.0
+        for i in range(lo, hi):
+            total += arr[i]
+            if i - lo >= window:
+                total -= arr[i - window]
+            out[i] = total / min(i - lo + 1, window)
+    return out
 
 # Load and prepare data
 def load_and_prepare_data():
-    """Load and clean the COVID-19 dataset"""
+    """Load and clean the COVID-19 dataset, reusing the Parquet cache when fresh"""
     try:
-        df = pd.read_csv("Covid_Analysis_Data.csv", parse_dates=['date'])
+        cache_key = get_cache_key()
+        cached = load_cached_data(cache_key)
+        if cached is not None:
+            return cached
+        
+        df = pd.read_csv(DATA_FILE, engine='pyarrow', usecols=list(DATA_COLUMNS), dtype=DATA_COLUMNS)
         
         # Clean data
         df = df.dropna(subset=['date', 'location', 'total_cases', 'total_deaths', 'population'])
-        df = df.sort_values(['location', 'date'])
+        # Store locations as integer codes so sorting, filters and groupbys skip string compares
+        df['location'] = df['location'].astype('category')
+        df = df.sort_values(['location', 'date']).reset_index(drop=True)
+        
+        # Calculate additional metrics on the raw arrays (zero denominators become NaN)
+        cases = df['total_cases'].to_numpy(dtype=np.float64)
+        deaths = df['total_deaths'].to_numpy(dtype=np.float64)
+        pop = df['population'].to_numpy(dtype=np.float64)
+        cfr = np.divide(deaths * 100, cases, out=np.full_like(cases, np.nan), where=cases != 0)
+        inv_pop = np.divide(1_000_000, pop, out=np.full_like(pop, np.nan), where=pop != 0)
+        # Kept at full precision; the KPI cards and table format them for display
+        df['case_fatality_rate'] = cfr
+        df['cases_per_million'] = cases * inv_pop
+        df['deaths_per_million'] = deaths * inv_pop
         
-        # Calculate additional metrics
-        df['case_fatality_rate'] = (df['total_deaths'] / df['total_cases'] * 100).round(2)
-        df['cases_per_million'] = (df['total_cases'] / df['population'] * 1_000_000).round(2)
-        df['deaths_per_million'] = (df['total_deaths'] / df['population'] * 1_000_000).round(2)
+        # Mark the first row of each location in the sorted frame
+        codes = df['location'].cat.codes.to_numpy()
+        is_start = np.ones(len(codes), dtype=bool)
+        is_start[1:] = codes[1:] != codes[:-1]
+        starts = np.append(np.flatnonzero(is_start), len(codes))
         
-        # Calculate daily new cases and deaths
-        df['new_cases'] = df.groupby('location')['total_cases'].diff().fillna(0)
-        df['new_deaths'] = df.groupby('location')['total_deaths'].diff().fillna(0)
+        # Calculate daily new cases and deaths (0 on each location's first row)
+        for total_col, new_col in [('total_cases', 'new_cases'), ('total_deaths', 'new_deaths')]:
+            totals = df[total_col].to_numpy(dtype=np.float64)
+            daily = np.empty_like(totals)
+            daily[1:] = totals[1:] - totals[:-1]
+            daily[is_start] = 0
+            df[new_col] = daily
         
-        # Calculate 7-day rolling averages
-        df['new_cases_7day'] = df.groupby('location')['new_cases'].rolling(window=7, min_periods=1).mean().reset_index(0, drop=True)
-        df['new_deaths_7day'] = df.groupby('location')['new_deaths'].rolling(window=7, min_periods=1).mean().reset_index(0, drop=True)
+        # Calculate 7-day rolling averages in one pass over the sorted rows
+        for col in ['new_cases', 'new_deaths']:
+            values = df[col].to_numpy(dtype=np.float64)
+            df[f'{col}_7day'] = rolling_mean_groups(values, starts, 7, np.empty_like(values))
         
+        # Shrink column dtypes: counts become the smallest integer type that holds them
+        # (daily counts can be negative after corrections), rates and averages float32
+        for col in ['total_cases', 'total_deaths', 'population']:
+            df[col] = pd.to_numeric(df[col], downcast='unsigned')
+        for col in ['new_cases', 'new_deaths']:
+            df[col] = pd.to_numeric(df[col], downcast='integer')
+        for col in ['case_fatality_rate', 'cases_per_million', 'deaths_per_million',
+                    'new_cases_7day', 'new_deaths_7day']:
+            df[col] = df[col].astype(np.float32)
+        
+        save_cached_data(df, cache_key)
         return df
     except Exception as e:
         print(f"Error loading data: {e}")
@@ -47,6 +152,110 @@ def load_and_prepare_data():
 # Load data
 df = load_and_prepare_data()
 
+# Dropdown choices, built once from the category labels instead of scanning the frame
+LOCATIONS = sorted(df['location'].cat.categories.tolist()) if not df.empty else []
+LOCATION_OPTIONS = [{'label': c, 'value': c} for c in LOCATIONS]
+DEFAULT_COUNTRY = 'Kenya' if 'Kenya' in set(LOCATIONS) else (LOCATIONS[0] if LOCATIONS else None)
+
+# Dates as int64 nanoseconds, so range filters are plain integer compares
+if not df.empty:
+    df['date_ns'] = df['date'].to_numpy(dtype='datetime64[ns]').view(np.int64)
+
+def to_ns(date):
+    """Convert a date picker value to int64 nanoseconds"""
+    return pd.Timestamp(date).value
+
+# Per-location frames, so single-country lookups are a dict fetch instead of a full-frame mask
+BY_COUNTRY = {name: sub.reset_index(drop=True) for name, sub in df.groupby('location', observed=True, sort=False)} if not df.empty else {}
+
+def get_country_slice(country, start_date, end_date):
+    """Return one country's rows within the date range"""
+    country_df = BY_COUNTRY.get(country)
+    if country_df is None:
+        return df.iloc[0:0]
+    # Each frame is sorted by date, so the range is a contiguous slice found by binary search
+    dates_ns = country_df['date_ns'].to_numpy()
+    lo = np.searchsorted(dates_ns, to_ns(start_date), side='left')
+    hi = np.searchsorted(dates_ns, to_ns(end_date), side='right')
+    return country_df.iloc[lo:hi]
+
+# Points kept per line trace: about one per horizontal pixel of a full-width chart
+MAX_TRACE_POINTS = 1000
+
+def lttb_indices(x, y, n_out):
+    """Return the positions kept by Largest-Triangle-Three-Buckets downsampling"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # First and last points are always kept; the rest are split into n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    keep = np.empty(n_out, dtype=np.intp)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        lo, hi = edges[i], edges[i + 1]
+        next_hi = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[hi:next_hi].mean()
+        avg_y = y[hi:next_hi].mean()
+        # Keep the bucket point forming the largest triangle with the last kept point and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[lo:hi] - y[a]) - (x[a] - x[lo:hi]) * (avg_y - y[a]))
+        a = lo + int(np.argmax(area))
+        keep[i + 1] = a
+    return keep
+
+def downsample_trace(series_df, column, n_out=MAX_TRACE_POINTS):
+    """Return the rows of a date-sorted frame that LTTB keeps for one plotted column"""
+    return series_df.iloc[lttb_indices(series_df['date_ns'].to_numpy(), series_df[column].to_numpy(), n_out)]
+
+# Each location's most recent row, keyed by name
+LATEST = {row['location']: row for row in df.groupby('location', observed=True).tail(1).to_dict('records')} if not df.empty else {}
+
+# Row order by date (stable, so locations stay sorted within a day) for daily snapshots
+date_order = np.argsort(df['date_ns'].to_numpy(), kind='stable') if not df.empty else np.array([], dtype=np.intp)
+dates_in_order = df['date_ns'].to_numpy()[date_order] if not df.empty else np.array([], dtype=np.int64)
+
+def find_latest_day(start_date, end_date):
+    """Return the latest day with data inside the range (as int64 ns), or None"""
+    hi = np.searchsorted(dates_in_order, to_ns(end_date), side='right')
+    if hi == 0 or dates_in_order[hi - 1] < to_ns(start_date):
+        return None
+    return int(dates_in_order[hi - 1])
+
+# Snapshots are shared between callbacks, so callers must not modify them
+@lru_cache(maxsize=64)
+def get_day_snapshot(day_ns):
+    """Return every location's row on one day"""
+    lo = np.searchsorted(dates_in_order, day_ns, side='left')
+    hi = np.searchsorted(dates_in_order, day_ns, side='right')
+    return df.iloc[date_order[lo:hi]]
+
+@lru_cache(maxsize=64)
+def get_day_top_countries(day_ns):
+    """Return the 15 locations with the most total cases on one day"""
+    snapshot = get_day_snapshot(day_ns)
+    cases = snapshot['total_cases'].to_numpy(dtype=np.float64)
+    k = min(15, len(cases))
+    if k == 0:
+        return snapshot
+    # Partial partition finds the k-th largest total in O(n); it orders ties arbitrarily,
+    # so every row tied with it is kept and ranked by total, then row position
+    # (matching nlargest's keep='first')
+    kth = cases[np.argpartition(-cases, k - 1)[k - 1]]
+    candidates = np.flatnonzero(cases >= kth)
+    top = candidates[np.lexsort((candidates, -cases[candidates]))][:k]
+    return snapshot.iloc[top]
+
+def get_latest_snapshot(start_date, end_date):
+    """Return every location's row on the latest date within the range"""
+    day_ns = find_latest_day(start_date, end_date)
+    return df.iloc[0:0] if day_ns is None else get_day_snapshot(day_ns)
+
+# The default date range ends on the last day, so build that snapshot up front
+if not df.empty:
+    get_day_top_countries(int(dates_in_order[-1]))
+
 # Initialize Dash app with Flask server
 app = dash.Dash(__name__, 
                 server=server,
@@ -58,34 +267,43 @@ app = dash.Dash(__name__,
 app.title = "COVID-19 Professional Dashboard"
 
 # Static file serving routes - Fixed for production
+# The report and chart images never change at runtime, so browsers may keep them for a year;
+# links carry the file's mtime (see static_url) so a replaced file gets a new URL
+STATIC_MAX_AGE = 31536000
+
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+IMAGES_DIR = os.path.join(STATIC_DIR, 'images')
+
+# send_from_directory stats the file itself and raises NotFound, so no separate exists() check
 @server.route("/static/<path:filename>")
 def serve_static(filename):
     """Serve static files"""
     try:
-        # Check if file exists in static directory
-        static_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
-        if os.path.exists(os.path.join(static_dir, filename)):
-            return send_from_directory(static_dir, filename)
-        else:
-            print(f"Static file not found: {filename}")
-            abort(404)
-    except Exception as e:
-        print(f"Error serving static file {filename}: {e}")
+        response = send_from_directory(STATIC_DIR, filename, max_age=STATIC_MAX_AGE)
+    except NotFound:
+        print(f"Static file not found: {filename}")
         abort(404)
+    response.cache_control.immutable = True
+    return response
 
 @server.route("/static/images/<path:filename>")
 def serve_images(filename):
     """Serve image files from static/images directory"""
     try:
-        images_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static', 'images')
-        if os.path.exists(os.path.join(images_dir, filename)):
-            return send_from_directory(images_dir, filename)
-        else:
-            print(f"Image file not found: {filename}")
-            abort(404)
-    except Exception as e:
-        print(f"Error serving image file {filename}: {e}")
+        response = send_from_directory(IMAGES_DIR, filename, max_age=STATIC_MAX_AGE)
+    except NotFound:
+        print(f"Image file not found: {filename}")
         abort(404)
+    response.cache_control.immutable = True
+    return response
+
+def static_url(filename):
+    """Return the URL for a static file, versioned by its modification time"""
+    try:
+        version = int(os.path.getmtime(os.path.join(STATIC_DIR, filename)))
+    except OSError:
+        return f"/static/{filename}"
+    return f"/static/{filename}?v={version}"
 
 # Define color scheme
 colors = {
@@ -247,9 +465,10 @@ def create_kpi_card(icon, value, label, color):
         html.Div(label, style=custom_styles['kpi-label'])
     ], style=custom_styles['kpi-card'])
 
+@lru_cache(maxsize=4096)
 def format_number(num):
     """Format large numbers with K, M, B suffixes"""
-    if pd.isna(num):
+    if num != num:  # NaN
         return "N/A"
     if num >= 1_000_000_000:
         return f"{num/1_000_000_000:.1f}B"
@@ -260,6 +479,15 @@ def format_number(num):
     else:
         return f"{num:,.0f}"
 
+def format_numbers(values):
+    """Format a whole array like format_number, choosing suffixes with np.select"""
+    values = np.asarray(values, dtype=np.float64)
+    conditions = [values >= 1_000_000_000, values >= 1_000_000, values >= 1_000]
+    scaled = np.select(conditions, [values / 1_000_000_000, values / 1_000_000, values / 1_000], default=values)
+    suffixes = np.select(conditions, ['B', 'M', 'K'], default='')
+    return ["N/A" if v != v else (f"{v:.1f}{suffix}" if suffix else f"{v:,.0f}")
+            for v, suffix in zip(scaled, suffixes)]
+
 def check_file_exists(file_path):
     """Check if file exists and return appropriate path"""
     if os.path.exists(file_path):
@@ -275,6 +503,42 @@ def create_placeholder_div(message):
         style=custom_styles['placeholder-chart']
     )
 
+# Static report image configurations
+STATIC_CHART_CONFIGS = [
+    {
+        'filename': 'global_cases_deaths.png',
+        'alt': 'Global Cases and Deaths Chart',
+        'placeholder': 'Global COVID-19 Cases and Deaths Chart Not Available'
+    },
+    {
+        'filename': 'kenya_trend.png',
+        'alt': 'Kenya Trend Chart',
+        'placeholder': 'Kenya COVID-19 Trend Chart Not Available'
+    },
+    {
+        'filename': 'correlation_heatmap.png',
+        'alt': 'Correlation Heatmap',
+        'placeholder': 'Statistical Correlation Heatmap Not Available'
+    }
+]
+
+def create_static_chart(config):
+    """Create an img element for a report image, or a placeholder if it is missing"""
+    image_path = os.path.join('static', 'images', config['filename'])
+    
+    if check_file_exists(image_path):
+        # Image exists, create img element with URL
+        return html.Img(
+            src=static_url(f"images/{config['filename']}"),
+            alt=config['alt'],
+            style=custom_styles['static-chart']
+        )
+    # Image doesn't exist, create placeholder
+    return create_placeholder_div(config['placeholder'])
+
+# Static files don't move during a session, so build these once and place them in the layout
+STATIC_CHART_CONTAINERS = tuple(create_static_chart(config) for config in STATIC_CHART_CONFIGS)
+
 # App Layout
 app.layout = html.Div([
     # Header Section
@@ -302,8 +566,8 @@ app.layout = html.Div([
                 html.Label("Select Country:", style={'fontWeight': '600', 'marginBottom': '8px', 'display': 'block'}),
                 dcc.Dropdown(
                     id='country-dropdown',
-                    options=[{'label': c, 'value': c} for c in sorted(df['location'].unique())] if not df.empty else [],
-                    value='Kenya' if 'Kenya' in df['location'].unique() else (df['location'].iloc[0] if not df.empty else None),
+                    options=LOCATION_OPTIONS,
+                    value=DEFAULT_COUNTRY,
                     style={'marginBottom': '20px'}
                 ),
             ], style={'width': '48%', 'display': 'inline-block'}),
@@ -312,7 +576,7 @@ app.layout = html.Div([
                 html.Label("Select Comparison Countries:", style={'fontWeight': '600', 'marginBottom': '8px', 'display': 'block'}),
                 dcc.Dropdown(
                     id='comparison-dropdown',
-                    options=[{'label': c, 'value': c} for c in sorted(df['location'].unique())] if not df.empty else [],
+                    options=LOCATION_OPTIONS,
                     value=['United States', 'India', 'Brazil'] if not df.empty else [],
                     multi=True,
                     style={'marginBottom': '20px'}
@@ -342,7 +606,7 @@ app.layout = html.Div([
             html.I(className="fas fa-download", style={'marginRight': '8px'}),
             "📥 Download Professional Report (PDF)"
         ], 
-        href="/static/Professional_Covid_Report.pdf",
+        href=static_url("Professional_Covid_Report.pdf"),
         target="_blank",
         style={
             **custom_styles['download-button'],
@@ -361,7 +625,7 @@ app.layout = html.Div([
         # Global Cases and Deaths Chart
         html.Div([
             html.H3("Global COVID-19 Cases and Deaths Overview", style={'color': colors['secondary'], 'marginBottom': '15px'}),
-            html.Div(id='global-chart-container'),
+            html.Div(STATIC_CHART_CONTAINERS[0], id='global-chart-container'),
             html.P("This visualization shows the global progression of COVID-19 cases and deaths, highlighting key trends and patterns observed throughout the pandemic.", 
                    style={'marginTop': '15px', 'fontStyle': 'italic', 'color': colors['gray']})
         ], style=custom_styles['chart-card']),
@@ -369,7 +633,7 @@ app.layout = html.Div([
         # Kenya Trend Chart
         html.Div([
             html.H3("COVID-19 Trends in Kenya", style={'color': colors['secondary'], 'marginBottom': '15px'}),
-            html.Div(id='kenya-chart-container'),
+            html.Div(STATIC_CHART_CONTAINERS[1], id='kenya-chart-container'),
             html.P("Detailed analysis of Kenya's COVID-19 trajectory, showcasing the country's unique pandemic experience and response effectiveness.", 
                    style={'marginTop': '15px', 'fontStyle': 'italic', 'color': colors['gray']})
         ], style=custom_styles['chart-card']),
@@ -377,7 +641,7 @@ app.layout = html.Div([
         # Correlation Heatmap
         html.Div([
             html.H3("Statistical Correlation Analysis", style={'color': colors['secondary'], 'marginBottom': '15px'}),
-            html.Div(id='correlation-chart-container'),
+            html.Div(STATIC_CHART_CONTAINERS[2], id='correlation-chart-container'),
             html.P("Advanced correlation matrix revealing relationships between various COVID-19 metrics and demographic factors.", 
                    style={'marginTop': '15px', 'fontStyle': 'italic', 'color': colors['gray']})
         ], style=custom_styles['chart-card']),
@@ -421,9 +685,11 @@ app.layout = html.Div([
                     {'name': 'Cases per Million', 'id': 'cases_per_million', 'type': 'numeric', 'format': {'specifier': ',.1f'}},
                     {'name': 'Case Fatality Rate (%)', 'id': 'case_fatality_rate', 'type': 'numeric', 'format': {'specifier': '.2f'}},
                 ],
-                sort_action='native',
-                filter_action='native',
-                page_action='native',
+                # Paging, sorting and filtering run server-side so only one page is sent
+                sort_action='custom',
+                filter_action='custom',
+                page_action='custom',
+                page_current=0,
                 page_size=10,
                 style_cell={'textAlign': 'left', 'fontFamily': 'Inter, sans-serif'},
                 style_header={'backgroundColor': colors['primary'], 'color': 'white', 'fontWeight': 'bold'},
@@ -452,56 +718,6 @@ app.layout = html.Div([
     
 ], style=custom_styles['dashboard-container'])
 
-# Callback to load static images with better error handling
-@app.callback(
-    [Output('global-chart-container', 'children'),
-     Output('kenya-chart-container', 'children'),
-     Output('correlation-chart-container', 'children')],
-    [Input('country-dropdown', 'value')]  # Dummy input to trigger callback
-)
-def load_static_images(selected_country):
-    """Load static chart images with improved error handling"""
-    
-    # Image configurations
-    image_configs = [
-        {
-            'filename': 'global_cases_deaths.png',
-            'alt': 'Global Cases and Deaths Chart',
-            'placeholder': 'Global COVID-19 Cases and Deaths Chart Not Available'
-        },
-        {
-            'filename': 'kenya_trend.png',
-            'alt': 'Kenya Trend Chart',
-            'placeholder': 'Kenya COVID-19 Trend Chart Not Available'
-        },
-        {
-            'filename': 'correlation_heatmap.png',
-            'alt': 'Correlation Heatmap',
-            'placeholder': 'Statistical Correlation Heatmap Not Available'
-        }
-    ]
-    
-    containers = []
-    
-    for config in image_configs:
-        # Check if image file exists
-        image_path = os.path.join('static', 'images', config['filename'])
-        
-        if check_file_exists(image_path):
-            # Image exists, create img element with URL
-            container = html.Img(
-                src=f"/static/images/{config['filename']}",
-                alt=config['alt'],
-                style=custom_styles['static-chart']
-            )
-        else:
-            # Image doesn't exist, create placeholder
-            container = create_placeholder_div(config['placeholder'])
-        
-        containers.append(container)
-    
-    return containers[0], containers[1], containers[2]
-
 # Callback for KPI cards
 @app.callback(
     Output('kpi-cards', 'children'),
@@ -514,17 +730,20 @@ def update_kpi_cards(selected_country, start_date, end_date):
     if df.empty or not selected_country:
         return []
     
-    # Filter data
-    filtered_df = df[
-        (df['location'] == selected_country) &
-        (df['date'] >= start_date) &
-        (df['date'] <= end_date)
-    ]
-    
-    if filtered_df.empty:
-        return []
-    
-    latest_data = filtered_df.iloc[-1]
+    return build_kpi_cards(selected_country, start_date, end_date)
+
+@cache.memoize()
+def build_kpi_cards(selected_country, start_date, end_date):
+    """Build the KPI card row for one country's latest row in the date range"""
+    # The common case (range reaching the end of the data) is a dict lookup
+    latest_data = LATEST.get(selected_country)
+    if latest_data is None or not (to_ns(start_date) <= latest_data['date_ns'] <= to_ns(end_date)):
+        filtered_df = get_country_slice(selected_country, start_date, end_date)
+        
+        if filtered_df.empty:
+            return []
+        
+        latest_data = filtered_df.iloc[-1]
     
     total_cases = latest_data['total_cases']
     total_deaths = latest_data['total_deaths']
@@ -543,28 +762,47 @@ def update_kpi_cards(selected_country, start_date, end_date):
     [Output('country-trends', 'figure'),
      Output('multi-country-comparison', 'figure'),
      Output('global-scatter', 'figure'),
-     Output('top-countries-bar', 'figure'),
-     Output('data-table', 'data')],
+     Output('top-countries-bar', 'figure')],
     [Input('country-dropdown', 'value'),
      Input('comparison-dropdown', 'value'),
      Input('date-range-picker', 'start_date'),
      Input('date-range-picker', 'end_date')]
 )
 def update_interactive_charts(selected_country, comparison_countries, start_date, end_date):
-    """Update all interactive charts"""
+    """Update all interactive charts, rebuilding only the outputs whose inputs changed"""
     if df.empty:
         empty_fig = go.Figure()
         empty_fig.add_annotation(text="No data available", x=0.5, y=0.5, showarrow=False)
-        return empty_fig, empty_fig, empty_fig, empty_fig, []
+        return empty_fig, empty_fig, empty_fig, empty_fig
     
-    # Filter data by date range
-    date_filtered_df = df[
-        (df['date'] >= start_date) &
-        (df['date'] <= end_date)
-    ]
+    # An empty prop id means the initial call, which has to fill every output
+    triggered = {t['prop_id'].split('.')[0] for t in dash.callback_context.triggered}
+    rebuild_all = not triggered or '' in triggered or 'date-range-picker' in triggered
     
-    # Country trends chart
-    country_df = date_filtered_df[date_filtered_df['location'] == selected_country]
+    if rebuild_all or 'country-dropdown' in triggered:
+        fig_trends = build_country_trends(selected_country, start_date, end_date)
+    else:
+        fig_trends = dash.no_update
+    
+    if rebuild_all or 'comparison-dropdown' in triggered:
+        # Lists are unhashable, so pass the comparison selection to the cache as a tuple
+        fig_comparison = build_comparison_chart(tuple(comparison_countries or ()), start_date, end_date)
+    else:
+        fig_comparison = dash.no_update
+    
+    if rebuild_all:
+        fig_scatter, fig_bar = build_global_views(start_date, end_date)
+    else:
+        fig_scatter = fig_bar = dash.no_update
+    
+    return fig_trends, fig_comparison, fig_scatter, fig_bar
+
+# Figure builders are memoized on their own inputs and return plain figure dicts,
+# which are cheap to unpickle from the cache and passed through by Dash as-is
+@cache.memoize()
+def build_country_trends(selected_country, start_date, end_date):
+    """Build the 2x2 trends figure for one country"""
+    country_df = get_country_slice(selected_country, start_date, end_date)
     
     fig_trends = make_subplots(
         rows=2, cols=2,
@@ -575,26 +813,20 @@ def update_interactive_charts(selected_country, comparison_countries, start_date
     )
     
     if not country_df.empty:
-        fig_trends.add_trace(
-            go.Scatter(x=country_df['date'], y=country_df['total_cases'], 
-                      name='Total Cases', line=dict(color=colors['primary'])),
-            row=1, col=1
-        )
-        fig_trends.add_trace(
-            go.Scatter(x=country_df['date'], y=country_df['total_deaths'], 
-                      name='Total Deaths', line=dict(color=colors['danger'])),
-            row=1, col=2
-        )
-        fig_trends.add_trace(
-            go.Scatter(x=country_df['date'], y=country_df['new_cases_7day'], 
-                      name='New Cases (7-day avg)', line=dict(color=colors['secondary'])),
-            row=2, col=1
-        )
-        fig_trends.add_trace(
-            go.Scatter(x=country_df['date'], y=country_df['new_deaths_7day'], 
-                      name='New Deaths (7-day avg)', line=dict(color=colors['accent'])),
-            row=2, col=2
-        )
+        # The 2x2 grid makes each subplot about half width, so half the points are enough
+        trend_traces = [
+            ('total_cases', 'Total Cases', colors['primary'], 1, 1),
+            ('total_deaths', 'Total Deaths', colors['danger'], 1, 2),
+            ('new_cases_7day', 'New Cases (7-day avg)', colors['secondary'], 2, 1),
+            ('new_deaths_7day', 'New Deaths (7-day avg)', colors['accent'], 2, 2),
+        ]
+        for column, name, color, row, col in trend_traces:
+            trace_df = downsample_trace(country_df, column, MAX_TRACE_POINTS // 2)
+            fig_trends.add_trace(
+                go.Scattergl(x=trace_df['date'], y=trace_df[column], 
+                          name=name, line=dict(color=color)),
+                row=row, col=col
+            )
     
     fig_trends.update_layout(
         title=f'COVID-19 Trends - {selected_country}',
@@ -603,58 +835,199 @@ def update_interactive_charts(selected_country, comparison_countries, start_date
         font=dict(family="Inter, sans-serif")
     )
     
-    # Multi-country comparison
-    comparison_df = date_filtered_df[date_filtered_df['location'].isin(comparison_countries or [])]
-    
-    fig_comparison = px.line(
-        comparison_df,
-        x='date',
-        y='total_cases',
-        color='location',
+    return fig_trends.to_plotly_json()
+
+@cache.memoize()
+def build_comparison_chart(comparison_countries, start_date, end_date):
+    """Build the total-cases line chart for the comparison countries"""
+    # The comparison countries' downsampled date slices, in location order (countries without rows get no line)
+    comparison_slices = [(c, downsample_trace(get_country_slice(c, start_date, end_date), 'total_cases'))
+                         for c in sorted(set(comparison_countries))]
+    comparison_slices = [(c, country_df) for c, country_df in comparison_slices if not country_df.empty]
+    # One line per country, built directly instead of through plotly express's grouping pass
+    palette = qualitative.Set1
+    fig_comparison = go.Figure()
+    for i, (country, country_df) in enumerate(comparison_slices):
+        fig_comparison.add_trace(go.Scattergl(
+            x=country_df['date'],
+            y=country_df['total_cases'],
+            name=country,
+            legendgroup=country,
+            showlegend=True,
+            mode='lines',
+            line=dict(color=palette[i % len(palette)]),
+            hovertemplate=f'location={country}<br>date=%{{x}}<br>total_cases=%{{y}}<extra></extra>'
+        ))
+    fig_comparison.update_layout(
         title='Multi-Country Comparison - Total Cases',
-        color_discrete_sequence=px.colors.qualitative.Set1
+        xaxis_title='date',
+        yaxis_title='total_cases',
+        legend_title_text='location',
+        font=dict(family="Inter, sans-serif")
     )
-    fig_comparison.update_layout(font=dict(family="Inter, sans-serif"))
     
+    return fig_comparison.to_plotly_json()
+
+@cache.memoize()
+def build_global_views(start_date, end_date):
+    """Build the scatter plot and top-15 bar chart for the latest snapshot"""
     # Global scatter plot
-    latest_date = date_filtered_df['date'].max()
-    latest_global_df = date_filtered_df[date_filtered_df['date'] == latest_date]
-    
-    fig_scatter = px.scatter(
-        latest_global_df,
-        x='population',
-        y='total_deaths',
-        color='location',
-        size='total_cases',
-        hover_name='location',
-        log_x=True,
+    latest_day = find_latest_day(start_date, end_date)
+    latest_global_df = df.iloc[0:0] if latest_day is None else get_day_snapshot(latest_day)
+    latest_date = latest_global_df['date'].max()
+    
+    # One marker trace per location (one row each), sized by area like plotly express with size_max=20
+    palette = qualitative.Set2
+    locations = latest_global_df['location'].to_numpy()
+    population = latest_global_df['population'].to_numpy()
+    deaths = latest_global_df['total_deaths'].to_numpy()
+    cases = latest_global_df['total_cases'].to_numpy()
+    sizeref = cases.max() / 20 ** 2 if len(cases) else 1
+    fig_scatter = go.Figure([
+        go.Scattergl(
+            x=population[i:i + 1],
+            y=deaths[i:i + 1],
+            hovertext=locations[i:i + 1],
+            name=location,
+            legendgroup=location,
+            showlegend=True,
+            mode='markers',
+            marker=dict(color=palette[i % len(palette)], size=cases[i:i + 1],
+                        sizemode='area', sizeref=sizeref),
+            hovertemplate=f'<b>%{{hovertext}}</b><br><br>location={location}<br>population=%{{x}}'
+                          f'<br>total_deaths=%{{y}}<br>total_cases=%{{marker.size}}<extra></extra>'
+        )
+        for i, location in enumerate(locations)
+    ])
+    fig_scatter.update_layout(
         title=f'Total Deaths vs Population - {latest_date.strftime("%Y-%m-%d")}',
-        color_discrete_sequence=px.colors.qualitative.Set2
+        xaxis=dict(type='log', title_text='population'),
+        yaxis_title='total_deaths',
+        legend=dict(title_text='location', itemsizing='constant'),
+        font=dict(family="Inter, sans-serif")
     )
-    fig_scatter.update_layout(font=dict(family="Inter, sans-serif"))
     
-    # Top countries bar chart
-    top_countries = latest_global_df.nlargest(15, 'total_cases')
+    # Top countries bar chart: a single trace coloured by its own values
+    top_countries = latest_global_df if latest_day is None else get_day_top_countries(latest_day)
+    top_cases = top_countries['total_cases'].to_numpy()
     
-    fig_bar = px.bar(
-        top_countries,
-        x='location',
-        y='total_cases',
-        title='Top 15 Countries by Total Cases',
-        color='total_cases',
-        color_continuous_scale='Viridis'
-    )
+    fig_bar = go.Figure(go.Bar(
+        x=top_countries['location'].to_numpy(),
+        y=top_cases,
+        marker=dict(color=top_cases, coloraxis='coloraxis'),
+        text=format_numbers(top_cases),
+        textposition='outside',
+        hovertemplate='location=%{x}<br>total_cases=%{y}<extra></extra>'
+    ))
     fig_bar.update_layout(
-        xaxis_tickangle=-45,
+        title='Top 15 Countries by Total Cases',
+        xaxis=dict(title_text='location', tickangle=-45),
+        yaxis_title='total_cases',
+        coloraxis=dict(colorscale=sequential.Viridis, colorbar_title_text='total_cases'),
         font=dict(family="Inter, sans-serif")
     )
     
-    # Data table
-    table_data = latest_global_df[['location', 'date', 'total_cases', 'total_deaths', 
-                                  'cases_per_million', 'case_fatality_rate']].to_dict('records')
+    return fig_scatter.to_plotly_json(), fig_bar.to_plotly_json()
+
+# Data table columns and the filter operators understood in its filter_query
+TABLE_COLUMNS = ['location', 'date', 'total_cases', 'total_deaths', 'cases_per_million', 'case_fatality_rate']
+FILTER_OPERATORS = [['ge ', '>='], ['le ', '<='], ['lt ', '<'], ['gt ', '>'],
+                    ['ne ', '!='], ['eq ', '='], ['contains '], ['datestartswith ']]
+COMPARISON_OPERATORS = ('eq', 'ne', 'lt', 'le', 'gt', 'ge')
+
+def split_filter_part(filter_part):
+    """Split one DataTable filter expression into (column, operator, value)"""
+    for operator_type in FILTER_OPERATORS:
+        for operator in operator_type:
+            if operator in filter_part:
+                name_part, value_part = filter_part.split(operator, 1)
+                name = name_part[name_part.find('{') + 1: name_part.rfind('}')]
+                value_part = value_part.strip()
+                operator_name = operator_type[0].strip()
+                quote = value_part[:1]
+                if quote and quote == value_part[-1] and quote in ("'", '"', '`'):
+                    value = value_part[1:-1].replace('\\' + quote, quote)
+                elif operator_name in ('contains', 'datestartswith'):
+                    value = value_part
+                else:
+                    try:
+                        value = float(value_part)
+                    except ValueError:
+                        value = value_part
+                return name, operator_name, value
+    return None, None, None
+
+def filter_mask(column, operator, value):
+    """Return the row mask for one filter part, or None if the value can't be compared with the column"""
+    if operator == 'contains':
+        return column.astype(str).str.contains(str(value), regex=False)
+    if operator == 'datestartswith':
+        return column.astype(str).str.startswith(str(value))
+    if operator not in COMPARISON_OPERATORS:
+        return None
+    try:
+        if pd.api.types.is_datetime64_any_dtype(column):
+            # Unquoted years and dates arrive parsed as numbers, e.g. `{date} > 2022`
+            if isinstance(value, float) and value.is_integer():
+                value = int(value)
+            value = pd.Timestamp(str(value))
+        elif isinstance(column.dtype, pd.CategoricalDtype):
+            # Location categories are unordered, so compare the labels as strings
+            column = column.astype(str)
+            value = str(value)
+        elif not isinstance(value, float):
+            # Text compared with a numeric column matches nothing sensible, so skip the part
+            return None
+        return getattr(column, operator)(value)
+    except (TypeError, ValueError):
+        return None
+
+# Callback for the data table
+@app.callback(
+    [Output('data-table', 'data'),
+     Output('data-table', 'page_count'),
+     Output('data-table', 'page_current')],
+    [Input('date-range-picker', 'start_date'),
+     Input('date-range-picker', 'end_date'),
+     Input('data-table', 'page_current'),
+     Input('data-table', 'page_size'),
+     Input('data-table', 'sort_by'),
+     Input('data-table', 'filter_query')]
+)
+def update_data_table(start_date, end_date, page_current, page_size, sort_by, filter_query):
+    """Return the visible page of the latest-snapshot table, with the page count and page number"""
+    if df.empty:
+        return [], 1, 0
+    
+    table_df = get_latest_snapshot(start_date, end_date)[TABLE_COLUMNS]
+    
+    # Apply column filters
+    for filter_part in (filter_query or '').split(' && '):
+        col_name, operator, value = split_filter_part(filter_part)
+        if col_name not in TABLE_COLUMNS:
+            continue
+        mask = filter_mask(table_df[col_name], operator, value)
+        if mask is not None:
+            table_df = table_df.loc[mask]
+    
+    # Apply sorting
+    if sort_by:
+        table_df = table_df.sort_values(
+            [col['column_id'] for col in sort_by],
+            ascending=[col['direction'] == 'asc' for col in sort_by]
+        )
     
-    return fig_trends, fig_comparison, fig_scatter, fig_bar, table_data
+    page_count = max(1, -(-len(table_df) // page_size))
+    # A new filter or date range starts again from the first page; otherwise the page is
+    # kept within the (possibly smaller) page count and sent back so the pager agrees
+    triggered = {t['prop_id'] for t in dash.callback_context.triggered}
+    if triggered & {'data-table.filter_query', 'date-range-picker.start_date', 'date-range-picker.end_date'}:
+        page_current = 0
+    page_current = min(page_current or 0, page_count - 1)
+    page_df = table_df.iloc[page_current * page_size:(page_current + 1) * page_size]
+    return page_df.to_dict('records'), page_count, page_current
 
+# Local development entry point; in production run `gunicorn app:server` (see gunicorn.conf.py)
 if __name__ == '__main__':
     # Get port from environment variable or default to 8050
     port = int(os.environ.get("PORT", 8050))
@@ -667,7 +1040,7 @@ if __name__ == '__main__':
     
     # Check if critical files exist
     required_files = [
-        "Covid_Analysis_Data.csv",
+        DATA_FILE,
         "static/Professional_Covid_Report.pdf",
         "static/images/global_cases_deaths.png",
         "static/images/kenya_trend.png", 
@@ -0,0 +1,9 @@
+# Gunicorn settings for production, picked up automatically by: gunicorn app:server
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 8050)}"
+workers = int(os.environ.get("WEB_CONCURRENCY", 4))
+
+# Import app.py (and build its DataFrame) once in the master process before forking,
+# so every worker shares the same memory pages copy-on-write
+preload_app = True